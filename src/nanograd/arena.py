@@ -0,0 +1,119 @@
+# Pooled allocation of intermediate Values for repeated training steps
+from __future__ import annotations
+
+import gc
+import sys
+
+from src.nanograd import value as value_module
+from src.nanograd.value import Value, _noop
+
+
+def _detach(nodes: list[Value]) -> None:
+    # Dropping _backward and children breaks the node <-> closure cycles and
+    # the references nodes hold to each other; a helper so no loop variable
+    # is left holding a node
+    for node in nodes:
+        node._backward = _noop
+        node.children = ()
+
+
+def _refcounts(nodes: list[Value]) -> list[int]:
+    """sys.getrefcount of every node, as seen from inside this function."""
+    getrefcount = sys.getrefcount
+    return [getrefcount(node) for node in nodes]
+
+
+# What _refcounts reports for an object held by nothing but its list, measured
+# rather than assumed since the count depends on the interpreter
+_UNREFERENCED = _refcounts([object()])[0]
+
+
+class Arena:
+    def __init__(self, max_pool_size: int = 1_000_000, disable_gc: bool = True):
+        """
+        Use as `with arena:` around one training step. Intermediate Values
+        created by operators inside are detached from the graph on exit and
+        recycled unless still referenced, so results such as loss or ypred
+        stay valid after the block. Labels are not built inside an arena.
+        Build models (parameters) outside of it.
+
+        An active arena replaces the process-wide node factory and, with
+        disable_gc, pauses the garbage collector for the whole process, so it
+        is not safe while other threads build Values.
+
+        max_pool_size: upper bound on released nodes kept for reuse
+        disable_gc: pause the cyclic garbage collector inside a step,
+        nodes are released explicitly on exit so it has nothing to do
+        """
+        self.max_pool_size = max_pool_size
+        self.disable_gc = disable_gc
+        self.num_allocated = 0
+        self.num_reused = 0
+        self._free = []
+        self._live = []
+        self._kept = set()
+        self._gc_was_enabled = False
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def allocate(
+        self,
+        data: float | int,
+        children: tuple[Value, Value] | tuple[Value] | tuple[()] = (),
+        operator: str = "",
+        label: str = "",
+    ) -> Value:
+        if self._free:
+            node = self._free.pop()
+            self.num_reused += 1
+        else:
+            node = object.__new__(Value)
+            self.num_allocated += 1
+        node.data = data
+        node.grad = 0.0
+        node._backward = _noop
+        node.children = children
+        node.operator = operator
+        node.label = label
+        self._live.append(node)
+        return node
+
+    def keep(self, node: Value) -> Value:
+        """Exclude node from recycling even if no reference to it remains."""
+        self._kept.add(node)
+        return node
+
+    def release(self) -> None:
+        live = self._live
+        _detach(live)
+        # Only nodes referenced by nothing but `live` are pooled; the rest
+        # escaped the step and are left to their holders
+        free = self._free
+        kept = self._kept
+        for node, refcount in zip(live, _refcounts(live)):
+            if len(free) >= self.max_pool_size:
+                break
+            if refcount <= _UNREFERENCED and node not in kept:
+                free.append(node)
+        live.clear()
+        kept.clear()
+
+    def clear(self) -> None:
+        self._free.clear()
+
+    def __enter__(self) -> Arena:
+        assert value_module._arena is None, "Arenas cannot be nested"
+        value_module._arena = self
+        value_module._new = self.allocate
+        if self.disable_gc:
+            self._gc_was_enabled = gc.isenabled()
+            gc.disable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        value_module._arena = None
+        value_module._new = Value
+        self.release()
+        if self.disable_gc and self._gc_was_enabled:
+            gc.enable()
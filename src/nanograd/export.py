@@ -0,0 +1,121 @@
+# Export trained MLPs to autograd-free inference programs
+from __future__ import annotations
+
+from operator import mul
+
+from src.nanograd.nn import MLP
+from src.nanograd.ops import get_op
+
+
+class Program:
+    def __init__(
+        self,
+        num_inputs: int,
+        layers: list[tuple[str, list[list[float]], list[float]]],
+    ):
+        """
+        layers: (activation_fn, weights, biases) per layer,
+        weights holds one row of num_inputs floats per neuron
+        """
+        width = num_inputs
+        for layer_idx, (_, weights, biases) in enumerate(layers):
+            assert len(biases) == len(
+                weights
+            ), f"Layer {layer_idx} has {len(weights)} weight rows but {len(biases)} biases"
+            for row in weights:
+                assert (
+                    len(row) == width
+                ), f"Layer {layer_idx} rows must have {width} weights, got {len(row)}"
+            width = len(weights)
+        self.num_inputs = num_inputs
+        self.layers = layers
+        self._ops = [get_op(activation_fn).vectorized for activation_fn, _, _ in layers]
+
+    def __call__(self, batch: list[list[float | int]]) -> list[float | list[float]]:
+        outputs = []
+        for x in batch:
+            assert (
+                len(x) == self.num_inputs
+            ), f"Input size must be {self.num_inputs}, got {len(x)}"
+            for activation, (_, weights, biases) in zip(self._ops, self.layers):
+                # Summing from the bias keeps results identical to Neuron.__call__
+                x = activation(
+                    [sum(map(mul, w, x), b) for w, b in zip(weights, biases)]
+                )
+            outputs.append(x[0] if len(x) == 1 else x)
+        return outputs
+
+    def predict(self, batch: list[list[float | int]]) -> list[float | list[float]]:
+        return self(batch)
+
+    def to_dict(self) -> dict:
+        return {
+            "num_inputs": self.num_inputs,
+            "layers": [
+                {"activation_fn": activation_fn, "weights": weights, "biases": biases}
+                for activation_fn, weights, biases in self.layers
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, program: dict) -> Program:
+        return cls(
+            program["num_inputs"],
+            [
+                (layer["activation_fn"], layer["weights"], layer["biases"])
+                for layer in program["layers"]
+            ],
+        )
+
+    def to_source(self, function_name: str = "predict") -> str:
+        """Standalone Python module defining function_name(batch)."""
+        lines = [
+            "# Generated by nanograd, do not edit",
+            "import math",
+            "from operator import mul",
+            "",
+        ]
+        for layer_idx, (_, weights, biases) in enumerate(self.layers):
+            lines.append(f"W{layer_idx} = {weights!r}")
+            lines.append(f"B{layer_idx} = {biases!r}")
+        lines += [
+            "",
+            "",
+            f"def {function_name}(batch):",
+            "    outputs = []",
+            "    for x in batch:",
+        ]
+        for layer_idx, (activation_fn, _, _) in enumerate(self.layers):
+            source = get_op(activation_fn).source
+            if source is None:
+                raise ValueError(
+                    f"Operator {activation_fn} has no source template to export"
+                )
+            expr = source.format(x="sum(map(mul, w, x), b)")
+            lines.append(
+                f"        x = [{expr} for w, b in zip(W{layer_idx}, B{layer_idx})]"
+            )
+        lines += [
+            "        outputs.append(x[0] if len(x) == 1 else x)",
+            "    return outputs",
+            "",
+        ]
+        return "\n".join(lines)
+
+
+def export(mlp: MLP) -> Program:
+    return Program(
+        len(mlp.layers[0].neurons[0].w),
+        [
+            (
+                layer.activation_fn,
+                [[w.data for w in neuron.w] for neuron in layer.neurons],
+                [neuron.b.data for neuron in layer.neurons],
+            )
+            for layer in mlp.layers
+        ],
+    )
+
+
+def export_source(mlp: MLP, function_name: str = "predict") -> str:
+    return export(mlp).to_source(function_name)
@@ -1,80 +1,113 @@
 import math
 import random
-from src.nanograd.value import Value
+from operator import mul
+from typing import Callable
+
+from src.nanograd import value as value_module
+from src.nanograd.value import Value, _label
+
+
+def init_weights(
+    num_weights: int,
+    num_inputs: int,
+    rng: random.Random | None = None,
+    **kwargs,
+) -> list[float]:
+    if rng is None:
+        seed = kwargs.get("seed")
+        # Without a seed use the global generator so random.seed() still applies
+        rng = random.Random(seed) if seed is not None else random
+    initialization = kwargs.get("initialization", kwargs.get("initilization", "normal"))
+    match initialization:
+        case "uniform":
+            uniform = rng.uniform
+            return [uniform(-1.0, 1.0) for _ in range(num_weights)]
+        case "normal":
+            mean = kwargs.get("mean", 0.0)
+            std = kwargs.get("std", 1.0)
+            gauss = rng.gauss
+            return [gauss(mean, std) for _ in range(num_weights)]
+        case "constant":
+            return [kwargs.get("value", 0.0)] * num_weights
+        case "xavier_uniform":
+            bound = kwargs.get("gain", 1.0) * math.sqrt(6.0 / (num_inputs + 1))
+            uniform = rng.uniform
+            return [uniform(-bound, bound) for _ in range(num_weights)]
+        case "xavier_normal":
+            std = kwargs.get("gain", 1.0) * math.sqrt(2.0 / (num_inputs + 1))
+            gauss = rng.gauss
+            return [gauss(0.0, std) for _ in range(num_weights)]
+        case "truncate_normal":
+            mean = kwargs.get("mean", 0.0)
+            std = kwargs.get("std", 1.0)
+            min_val = kwargs.get("min_val", -2.0)
+            max_val = kwargs.get("max_val", 2.0)
+            gauss = rng.gauss
+            return [
+                min(max(gauss(mean, std), min_val), max_val) for _ in range(num_weights)
+            ]
+        case _:
+            raise ValueError(f"Unknown initialization: {initialization}")
+
+
+def _wrap_inputs(x: list[float | int | Value], example_idx: int) -> list[Value]:
+    """Box plain inputs as Values through the node factory, pooled in an Arena."""
+    new = value_module._new
+    return [
+        (
+            x_i
+            if isinstance(x_i, Value)
+            else new(x_i, (), "", _label("e{}x{}", example_idx, feature_num))
+        )
+        for feature_num, x_i in enumerate(x)
+    ]
 
 
 class Neuron:
-    def __init__(self, num_inputs: int, layer_idx: int, neuron_idx: int, **kwargs):
+    def __init__(
+        self,
+        num_inputs: int,
+        layer_idx: int,
+        neuron_idx: int,
+        weights: list[float] | None = None,
+        **kwargs,
+    ):
         self.layer_idx = layer_idx
         self.neuron_idx = neuron_idx
 
-        weights_init = None
-        match kwargs.get("initilization", "normal"):
-            case "uniform":
-                weights_init = lambda: random.uniform(-1.0, 1.0)
-            case "normal":
-                mean = kwargs.get("mean", 0.0)
-                std = kwargs.get("std", 1.0)
-                weights_init = lambda: random.normalvariate(mean, std)
-            case "constant":
-                weights_init = lambda: kwargs.get("value", 0.0)
-            case "xavier_uniform":
-                gain = kwargs.get("gain", 1.0)
-                weights_init = lambda: random.uniform(-gain, gain) * math.sqrt(
-                    (6.0 / (num_inputs + 1))
-                )
-            case "xavier_normal":
-                gain = kwargs.get("gain", 1.0)
-                weights_init = lambda: random.normalvariate(0.0, gain) * math.sqrt(
-                    (2.0 / (num_inputs + 1))
-                )
-            case "truncate_normal":
-                mean = kwargs.get("mean", 0.0)
-                std = kwargs.get("std", 1.0)
-                min_val = kwargs.get("min_val", -2.0)
-                max_val = kwargs.get("max_val", 2.0)
-                weights_init = lambda: min(
-                    max(random.normalvariate(mean, std), min_val), max_val
-                )
-            case _:
-                raise ValueError(
-                    f"Unknown initilization: {kwargs.get('initilization', 'uniform')}"
-                )
+        if weights is None:
+            weights = init_weights(num_inputs + 1, num_inputs, **kwargs)
+        assert (
+            len(weights) == num_inputs + 1
+        ), f"Expected {num_inputs + 1} weights (including bias), got {len(weights)}"
+        prefix = f"l{layer_idx}n{neuron_idx}"
         self.w = [
-            Value(weights_init(), label=f"l{layer_idx}n{neuron_idx}w{input_idx}")
-            for input_idx in range(num_inputs)
+            Value(weight, label=f"{prefix}w{input_idx}")
+            for input_idx, weight in enumerate(weights[:num_inputs])
         ]
-        self.b = Value(weights_init(), label=f"l{layer_idx}n{neuron_idx}b")
+        self.b = Value(weights[num_inputs], label=f"{prefix}b")
 
     def __call__(
         self,
         x: list[float | int | Value],
         example_idx: int,
-        activation_fn: str = "linear",
+        activation_fn: Callable[[Value], Value] = Value.linear,
     ) -> Value:
+        w, b = self._weights()
         assert len(x) == len(
-            self.w
-        ), f"Input size must be equal to weight size x.size = {len(x)}, w.size = {len(self.w)}"
-        act = sum(
-            (
-                self.w[feature_num]
-                * (
-                    x[feature_num]
-                    if isinstance(x[feature_num], Value)
-                    else Value(x[feature_num], label=f"e{example_idx}x{feature_num}")
-                )
-                for feature_num in range(len(x))
-            ),
-            self.b,
-        )
-        out = Value.activations[activation_fn](act)
-        return out
+            w
+        ), f"Input size must be equal to weight size x.size = {len(x)}, w.size = {len(w)}"
+        act = sum(map(mul, w, _wrap_inputs(x, example_idx)), b)
+        return activation_fn(act)
+
+    def _weights(self) -> tuple[list[Value], Value]:
+        return self.w, self.b
 
     def forward(
         self,
         x: list[float | int | Value],
         example_idx: int,
-        activation_fn: str = "linear",
+        activation_fn: Callable[[Value], Value] = Value.linear,
     ) -> Value:
         return self(x, example_idx, activation_fn)
 
@@ -92,14 +125,23 @@ class Layer:
         **kwargs,
     ):
         self.activation_fn = activation_fn
+        self._activation = Value.activations[activation_fn]
         self.layer_idx = layer_idx
+        stride = num_inputs + 1
+        weights = init_weights(num_neurons * stride, num_inputs, **kwargs)
         self.neurons = [
-            Neuron(num_inputs, layer_idx, neuron_idx, *kwargs)
+            Neuron(
+                num_inputs,
+                layer_idx,
+                neuron_idx,
+                weights[neuron_idx * stride : (neuron_idx + 1) * stride],
+            )
             for neuron_idx in range(num_neurons)
         ]
 
     def __call__(self, x: list[float | int | Value], example_idx: int) -> list[Value]:
-        outs = [neuron(x, example_idx, self.activation_fn) for neuron in self.neurons]
+        x = _wrap_inputs(x, example_idx)
+        outs = [neuron(x, example_idx, self._activation) for neuron in self.neurons]
         return outs[0] if len(outs) == 1 else outs
 
     def forward(self, x: list[float | int | Value], example_idx: int) -> list[Value]:
@@ -127,6 +169,8 @@ class MLP:
         assert len(layer_sizes) == len(
             activation_fn
         ), f"Number of layers must be equal to number of activation functions, got {len(layer_sizes)} layers and {len(activation_fn)} activation functions"
+        if "rng" not in kwargs and kwargs.get("seed") is not None:
+            kwargs["rng"] = random.Random(kwargs["seed"])
         all_layers = [num_inputs] + layer_sizes
         self.layers = [
             Layer(
@@ -134,7 +178,7 @@ class MLP:
                 all_layers[layer_idx + 1],
                 layer_idx,
                 activation_fn[layer_idx],
-                *kwargs,
+                **kwargs,
             )
             for layer_idx in range(len(layer_sizes))
         ]
@@ -0,0 +1,154 @@
+# Registry of unary operators shared by Value, nn and batched execution paths
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+
+class Op:
+    def __init__(
+        self,
+        name: str,
+        forward: Callable[[float], float],
+        derivative: Callable[[float, float], float],
+        vectorized: Callable[[list[float]], list[float]] | None = None,
+        fused: Callable[[float], tuple[float, float]] | None = None,
+        source: str | None = None,
+    ):
+        """
+        forward: x -> y
+        derivative: (x, y) -> dy/dx, evaluated lazily during backward
+        vectorized: [x] -> [y], used by batched paths instead of per-item forward
+        fused: x -> (y, dy/dx), computes both in one pass during forward
+        source: Python expression template over {x}, used by code exporters
+        """
+        self.name = name
+        self.forward = forward
+        self.derivative = derivative
+        self.vectorized = (
+            vectorized if vectorized is not None else lambda xs: list(map(forward, xs))
+        )
+        self.fused = fused
+        self.source = source
+
+    def __repr__(self) -> str:
+        return f"Op(name={self.name})"
+
+
+OPS: dict[str, Op] = {}
+_listeners: list[Callable[[Op], None]] = []
+_unregister_listeners: list[Callable[[Op], None]] = []
+
+
+def register_op(
+    name: str,
+    forward: Callable[[float], float],
+    derivative: Callable[[float, float], float],
+    vectorized: Callable[[list[float]], list[float]] | None = None,
+    fused: Callable[[float], tuple[float, float]] | None = None,
+    source: str | None = None,
+) -> Op:
+    op = Op(name, forward, derivative, vectorized, fused, source)
+    # Listeners run first so one rejecting the op leaves the registry untouched
+    for listener in _listeners:
+        listener(op)
+    OPS[name] = op
+    return op
+
+
+def unregister_op(name: str) -> Op:
+    op = get_op(name)
+    del OPS[name]
+    for listener in _unregister_listeners:
+        listener(op)
+    return op
+
+
+def get_op(name: str) -> Op:
+    if name not in OPS:
+        raise ValueError(f"Unknown operator: {name}")
+    return OPS[name]
+
+
+def on_register(listener: Callable[[Op], None]) -> None:
+    """Call listener for every registered op, now and on future registrations."""
+    _listeners.append(listener)
+    for op in list(OPS.values()):
+        listener(op)
+
+
+def on_unregister(listener: Callable[[Op], None]) -> None:
+    _unregister_listeners.append(listener)
+
+
+def _tanh_fused(x: float) -> tuple[float, float]:
+    t = math.tanh(x)
+    return t, 1 - t**2
+
+
+def _sigmoid(x: float) -> float:
+    return 1 / (1 + math.exp(-x))
+
+
+def _sigmoid_fused(x: float) -> tuple[float, float]:
+    s = _sigmoid(x)
+    return s, (1 - s) * s
+
+
+def _exp_fused(x: float) -> tuple[float, float]:
+    e = math.exp(x)
+    return e, e
+
+
+register_op("linear", lambda x: x, lambda x, y: 1.0, vectorized=list, source="{x}")
+register_op(
+    "tanh",
+    math.tanh,
+    lambda x, y: 1 - y**2,
+    vectorized=lambda xs: list(map(math.tanh, xs)),
+    fused=_tanh_fused,
+    source="math.tanh({x})",
+)
+register_op(
+    "relu",
+    lambda x: max(0, x),
+    lambda x, y: float(x > 0),
+    vectorized=lambda xs: [x if x > 0 else 0 for x in xs],
+    source="max(0, {x})",
+)
+register_op(
+    "sigmoid",
+    _sigmoid,
+    lambda x, y: (1 - y) * y,
+    fused=_sigmoid_fused,
+    source="1 / (1 + math.exp(-{x}))",
+)
+register_op(
+    "exp",
+    math.exp,
+    lambda x, y: y,
+    vectorized=lambda xs: list(map(math.exp, xs)),
+    fused=_exp_fused,
+    source="math.exp({x})",
+)
+register_op(
+    "log",
+    math.log,
+    lambda x, y: 1 / x,
+    vectorized=lambda xs: list(map(math.log, xs)),
+    source="math.log({x})",
+)
+register_op(
+    "cos",
+    math.cos,
+    lambda x, y: -math.sin(x),
+    vectorized=lambda xs: list(map(math.cos, xs)),
+    source="math.cos({x})",
+)
+register_op(
+    "sin",
+    math.sin,
+    lambda x, y: math.cos(x),
+    vectorized=lambda xs: list(map(math.sin, xs)),
+    source="math.sin({x})",
+)
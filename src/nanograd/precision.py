@@ -0,0 +1,288 @@
+# Compact float32 storage for MLP parameters and gradients
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+import weakref
+from array import array
+
+from src.nanograd import value as value_module
+from src.nanograd.arena import Arena
+from src.nanograd.nn import MLP, Neuron
+from src.nanograd.value import Value, _noop
+
+
+class _Leaf(Value):
+    __slots__ = ("storage", "index", "group")
+
+    def __init__(self, storage: ParameterStorage, index: int, label: str = ""):
+        self.data = storage.data[index]
+        self.grad = 0.0
+        self.children = ()
+        self.operator = ""
+        self.label = label
+        self.storage = storage
+        self.index = index
+        self.group = None
+
+    def _backward(self) -> None:
+        # Runs once every consumer has added to self.grad; the grad moves into
+        # the storage so a later backward() over the same leaves adds only its own
+        self.storage.grad[self.index] += self.grad
+        self.grad = 0.0
+
+
+class _LeafGroup(list):
+    # A weakly referenceable list, cached by the storage while graphs hold it
+    __slots__ = ("__weakref__",)
+
+
+class ParameterStorage:
+    def __init__(self, num_parameters: int, dtype: str = "f", grad_dtype: str = "f"):
+        """
+        dtype, grad_dtype: array typecodes, "f" for float32 and "d" for float64;
+        grad_dtype="d" accumulates float32 parameters' gradients in float64.
+        Arithmetic on the values read back is still Python (binary64) floats.
+        """
+        assert dtype in ("f", "d"), f"Unsupported dtype: {dtype}"
+        assert grad_dtype in ("f", "d"), f"Unsupported grad dtype: {grad_dtype}"
+        self.data = array(dtype, [0.0]) * num_parameters
+        self.grad = array(grad_dtype, [0.0]) * num_parameters
+        # Leaves by offset, alive only while some graph built from them is
+        self._leaves = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self) * (self.data.itemsize + self.grad.itemsize)
+
+    def leaves(self, offset: int, count: int, label: str = "") -> list[Value]:
+        """
+        Leaf Values for data[offset:offset + count], shared by every forward
+        pass until step() or until no graph references them. backward() adds
+        their grads to self.grad. They are not pooled by an Arena.
+        """
+        leaves = self._leaves.get(offset)
+        if leaves is None:
+            if label and value_module._arena is None:
+                leaves = _LeafGroup(
+                    _Leaf(self, idx, f"{label}{idx - offset}")
+                    for idx in range(offset, offset + count)
+                )
+            else:
+                leaves = _LeafGroup(
+                    _Leaf(self, idx) for idx in range(offset, offset + count)
+                )
+            # Each leaf keeps its group alive, so the cache entry lasts as long
+            # as any graph holding one of them
+            for leaf in leaves:
+                leaf.group = leaves
+            self._leaves[offset] = leaves
+        return leaves
+
+    def zero_grad(self) -> None:
+        self.grad[:] = array(self.grad.typecode, [0.0]) * len(self.grad)
+
+    def step(self, learning_rate: float) -> None:
+        self.data[:] = array(
+            self.data.typecode,
+            [p - learning_rate * g for p, g in zip(self.data, self.grad)],
+        )
+        self._leaves.clear()
+
+
+class ParameterView(Value):
+    __slots__ = ("storage", "offset", "position")
+
+    def __init__(
+        self, storage: ParameterStorage, offset: int, position: int, label: str = ""
+    ):
+        """
+        Value reading and writing storage.data[offset + position] and its grad.
+        Data writes also reach the leaf forward passes currently share, if any.
+        """
+        self.storage = storage
+        self.offset = offset
+        self.position = position
+        self._backward = _noop
+        self.children = ()
+        self.operator = ""
+        self.label = label
+
+    @property
+    def data(self) -> float:
+        return self.storage.data[self.offset + self.position]
+
+    @data.setter
+    def data(self, value: float | int) -> None:
+        self.storage.data[self.offset + self.position] = value
+        leaves = self.storage._leaves.get(self.offset)
+        if leaves is not None:
+            leaves[self.position].data = self.data
+
+    @property
+    def grad(self) -> float:
+        return self.storage.grad[self.offset + self.position]
+
+    @grad.setter
+    def grad(self, value: float | int) -> None:
+        self.storage.grad[self.offset + self.position] = value
+
+
+class CompactNeuron(Neuron):
+    def __init__(
+        self,
+        storage: ParameterStorage,
+        offset: int,
+        num_inputs: int,
+        layer_idx: int,
+        neuron_idx: int,
+    ):
+        """Weights live in storage[offset:offset + num_inputs], bias right after."""
+        self.layer_idx = layer_idx
+        self.neuron_idx = neuron_idx
+        self.storage = storage
+        self.offset = offset
+        self.num_inputs = num_inputs
+
+    def _weights(self) -> tuple[list[Value], Value]:
+        prefix = f"l{self.layer_idx}n{self.neuron_idx}"
+        leaves = self.storage.leaves(self.offset, self.num_inputs + 1, f"{prefix}w")
+        bias = leaves[-1]
+        if bias.label:
+            bias.label = f"{prefix}b"
+        return leaves[:-1], bias
+
+    @property
+    def w(self) -> list[ParameterView]:
+        prefix = f"l{self.layer_idx}n{self.neuron_idx}"
+        return [
+            ParameterView(self.storage, self.offset, input_idx, f"{prefix}w{input_idx}")
+            for input_idx in range(self.num_inputs)
+        ]
+
+    @property
+    def b(self) -> ParameterView:
+        return ParameterView(
+            self.storage,
+            self.offset,
+            self.num_inputs,
+            f"l{self.layer_idx}n{self.neuron_idx}b",
+        )
+
+
+def compact(mlp: MLP, dtype: str = "f", grad_dtype: str = "f") -> ParameterStorage:
+    """
+    Move all parameters of mlp into one storage, in place, dropping the
+    per-parameter Values. Forward passes share one set of leaf Values built
+    from the storage, and loss.backward() adds their grads to storage.grad;
+    follow it with storage.step(). mlp.parameters() returns ParameterViews
+    reading and writing the storage, so plain training loops work unchanged.
+    """
+    storage = ParameterStorage(len(mlp.parameters()), dtype, grad_dtype)
+    offset = 0
+    for layer in mlp.layers:
+        for neuron_idx, neuron in enumerate(layer.neurons):
+            num_inputs = len(neuron.w)
+            for idx, p in enumerate(neuron.parameters(), offset):
+                storage.data[idx] = p.data
+                storage.grad[idx] = p.grad
+            layer.neurons[neuron_idx] = CompactNeuron(
+                storage, offset, num_inputs, neuron.layer_idx, neuron.neuron_idx
+            )
+            offset += num_inputs + 1
+    return storage
+
+
+def benchmark(
+    num_inputs: int = 8,
+    layer_sizes: list[int] | None = None,
+    num_steps: int = 3,
+) -> dict:
+    """
+    Training steps run inside an Arena, so neither variant builds labels.
+
+    model_bytes: traced memory held by the model between training steps
+    step_peak_bytes: peak traced memory during a training step, graph included
+    inference_bytes: traced memory held after forward passes without backward,
+    once their outputs are dropped
+    storage_bytes: bytes holding parameter data and grads, boxed floats for
+    the baseline; float64_storage separates the layout from the element type
+    """
+    layer_sizes = layer_sizes if layer_sizes is not None else [32, 32, 1]
+    xs = [[(i + j) % 5 / 5 - 0.5 for j in range(num_inputs)] for i in range(4)]
+    ys = [1.0, -1.0, -1.0, 1.0]
+
+    def step(mlp: MLP, storage: ParameterStorage | None) -> None:
+        ypred = [mlp(x, example_idx) for example_idx, x in enumerate(xs)]
+        loss = sum(((ygt - yout) ** 2 for ygt, yout in zip(ys, ypred)))
+        if storage is None:
+            for p in mlp.parameters():
+                p.grad = 0.0
+            loss.backward()
+            for p in mlp.parameters():
+                p.data += -0.05 * p.grad
+        else:
+            storage.zero_grad()
+            loss.backward()
+            storage.step(0.05)
+
+    results = {}
+    for name, args in [
+        ("float64", None),
+        ("float64_storage", ("d", "d")),
+        ("float32", ("f", "f")),
+        ("float32_accumulate64", ("f", "d")),
+    ]:
+        gc.collect()
+        tracemalloc.start()
+        arena = Arena()
+        mlp = MLP(num_inputs, layer_sizes, "tanh", seed=0)
+        num_parameters = len(mlp.parameters())
+        storage = compact(mlp, *args) if args is not None else None
+        # One step first so the baseline's per-parameter grad floats exist
+        with arena:
+            step(mlp, storage)
+        arena.clear()
+        gc.collect()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        with arena:
+            step(mlp, storage)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        arena.clear()
+        for example_idx, x in enumerate(xs):
+            mlp(x, example_idx)
+        gc.collect()
+        inference_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for _ in range(num_steps):
+            with arena:
+                step(mlp, storage)
+        results[name] = {
+            "parameters": num_parameters,
+            "model_bytes": memory,
+            "step_peak_bytes": peak_memory,
+            "inference_bytes": inference_memory,
+            "storage_bytes": (
+                storage.nbytes
+                if storage is not None
+                else 2 * num_parameters * sys.getsizeof(0.0)
+            ),
+            "step_seconds": (time.perf_counter() - start) / num_steps,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    for name, stats in benchmark().items():
+        print(name)
+        for key, value in stats.items():
+            value = f"{value:.6f}" if isinstance(value, float) else value
+            print(f"  {key}: {value}")
@@ -0,0 +1,243 @@
+# Micro-batching asyncio predictor for serving MLPs
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+
+from src.nanograd.export import Program, export
+from src.nanograd.nn import MLP
+
+
+class PredictorMetrics:
+    def __init__(self, window: int = 10000):
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        self.num_requests = 0
+        self.num_batches = 0
+        self.num_errors = 0
+        # Latencies in seconds for the most recent `window` requests
+        self.latencies = deque(maxlen=self.window)
+        self.first_request = None
+        self.last_response = None
+
+    def record(self, batch_size: int, latencies: list[float], num_errors: int = 0):
+        self.num_requests += batch_size
+        self.num_batches += 1
+        self.num_errors += num_errors
+        self.latencies.extend(latencies)
+        self.last_response = time.perf_counter()
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.num_requests / self.num_batches if self.num_batches else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second since the first request."""
+        if self.first_request is None or self.last_response is None:
+            return 0.0
+        elapsed = self.last_response - self.first_request
+        return self.num_requests / elapsed if elapsed > 0 else 0.0
+
+    def latency_ms(self, percentile: float) -> float:
+        assert 0 <= percentile <= 100, "Percentile must be in [0, 100]"
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        idx = min(int(len(ordered) * percentile / 100), len(ordered) - 1)
+        return ordered[idx] * 1000
+
+    def summary(self) -> dict:
+        return {
+            "requests": self.num_requests,
+            "batches": self.num_batches,
+            "errors": self.num_errors,
+            "mean_batch_size": self.mean_batch_size,
+            "throughput": self.throughput,
+            "p50_ms": self.latency_ms(50),
+            "p99_ms": self.latency_ms(99),
+        }
+
+
+class BatchPredictor:
+    def __init__(
+        self,
+        model: MLP | Program,
+        max_batch_size: int = 32,
+        max_delay_ms: float = 2.0,
+    ):
+        assert max_batch_size > 0, "Batch size must be positive"
+        assert max_delay_ms >= 0, "Delay must be non-negative"
+        # Weights are snapshotted here; call reload() after further training
+        self.program = model if isinstance(model, Program) else export(model)
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+        self.metrics = PredictorMetrics()
+        self._queue = None
+        self._worker = None
+        # Requests taken off the queue by the worker but not yet resolved
+        self._batch = []
+
+    def reload(self, model: MLP | Program) -> None:
+        self.program = model if isinstance(model, Program) else export(model)
+
+    async def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        pending = self._batch
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future, _ in pending:
+            if not future.done():
+                future.cancel()
+        self._batch = []
+        self._worker = None
+        self._queue = None
+
+    async def __aenter__(self) -> BatchPredictor:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def predict(self, x: list[float | int]) -> float | list[float]:
+        if self._worker is None:
+            raise RuntimeError("BatchPredictor is not started")
+        # Rejected up front rather than failing inside the batched pass
+        assert (
+            len(x) == self.program.num_inputs
+        ), f"Input size must be {self.program.num_inputs}, got {len(x)}"
+        now = time.perf_counter()
+        if self.metrics.first_request is None:
+            self.metrics.first_request = now
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((x, future, now))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch = batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._process(batch)
+            self._batch = []
+
+    def _process(self, batch: list) -> None:
+        # Callers that gave up (cancelled) are dropped before running inference
+        batch = [item for item in batch if not item[1].done()]
+        if not batch:
+            return
+        num_errors = 0
+        try:
+            outputs = self.program([x for x, _, _ in batch])
+        except Exception:
+            # Rerun items one by one so only the failing requests get the error
+            for x, future, _ in batch:
+                try:
+                    future.set_result(self.program([x])[0])
+                except Exception as e:
+                    future.set_exception(e)
+                    num_errors += 1
+        else:
+            for (_, future, _), output in zip(batch, outputs):
+                future.set_result(output)
+        now = time.perf_counter()
+        self.metrics.record(len(batch), [now - t for _, _, t in batch], num_errors)
+
+
+async def load_test(
+    predictor: BatchPredictor,
+    num_requests: int = 1000,
+    concurrency: int = 64,
+    seed: int | None = None,
+) -> dict:
+    """
+    Fire num_requests random inputs with at most `concurrency` in flight.
+    Resets predictor.metrics so the returned figures cover this run only.
+    """
+    rng = random.Random(seed)
+    num_inputs = predictor.program.num_inputs
+    inputs = [
+        [rng.uniform(-1.0, 1.0) for _ in range(num_inputs)] for _ in range(num_requests)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+    predictor.metrics.reset()
+
+    async def request(x: list[float]):
+        async with semaphore:
+            return await predictor.predict(x)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request(x) for x in inputs))
+    elapsed = time.perf_counter() - start
+    return {"elapsed": elapsed, **predictor.metrics.summary()}
+
+
+def benchmark(
+    num_inputs: int = 16,
+    layer_sizes: list[int] | None = None,
+    num_requests: int = 2000,
+    concurrency: int = 64,
+    max_batch_size: int = 32,
+    max_delay_ms: float = 2.0,
+    baseline_requests: int = 50,
+) -> dict:
+    layer_sizes = layer_sizes if layer_sizes is not None else [16, 16, 1]
+    mlp = MLP(num_inputs, layer_sizes, "tanh", seed=0)
+
+    async def serve() -> dict:
+        async with BatchPredictor(mlp, max_batch_size, max_delay_ms) as predictor:
+            return await load_test(predictor, num_requests, concurrency, seed=0)
+
+    batched = asyncio.run(serve())
+
+    # Per-request MLP.__call__ for comparison, on fewer requests since it is slow
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for example_idx in range(baseline_requests):
+        mlp([rng.uniform(-1.0, 1.0) for _ in range(num_inputs)], example_idx)
+    elapsed = time.perf_counter() - start
+    return {
+        "batched": batched,
+        "per_request": {
+            "requests": baseline_requests,
+            "elapsed": elapsed,
+            "throughput": baseline_requests / elapsed,
+        },
+    }
+
+
+if __name__ == "__main__":
+    results = benchmark()
+    for name, stats in results.items():
+        print(name)
+        for key, value in stats.items():
+            value = f"{value:.4f}" if isinstance(value, float) else value
+            print(f"  {key}: {value}")
@@ -0,0 +1,144 @@
+# Tests for node arena
+
+import gc
+import math
+import unittest
+
+from src.nanograd.arena import Arena, _UNREFERENCED, _refcounts
+from src.nanograd.nn import MLP, Layer
+from src.nanograd import value as value_module
+from src.nanograd.tests.common import XS, train_step
+from src.nanograd.value import Value
+
+
+class TestArena(unittest.TestCase):
+    def test_training_parity(self):
+        x = MLP(3, [4, 4, 1], "tanh", seed=0)
+        y = MLP(3, [4, 4, 1], "tanh", seed=0)
+        arena = Arena()
+        for _ in range(5):
+            expected = train_step(x)
+            with arena:
+                loss = train_step(y)
+            self.assertAlmostEqual(loss, expected)
+        for p, q in zip(x.parameters(), y.parameters()):
+            self.assertAlmostEqual(p.data, q.data)
+
+    def test_reuse(self):
+        x = MLP(3, [4, 1], "tanh", seed=0)
+        arena = Arena()
+        with arena:
+            train_step(x)
+        num_allocated = arena.num_allocated
+        self.assertGreater(num_allocated, 0)
+        self.assertEqual(len(arena), num_allocated)
+        with arena:
+            train_step(x)
+        self.assertEqual(arena.num_allocated, num_allocated)
+        self.assertEqual(arena.num_reused, num_allocated)
+
+    def test_parameters_persistent(self):
+        x = MLP(3, [4, 1], "tanh", seed=0)
+        params = x.parameters()
+        arena = Arena()
+        with arena:
+            train_step(x)
+        pooled = set(map(id, arena._free))
+        self.assertFalse(any(id(p) in pooled for p in params))
+
+    def test_release(self):
+        arena = Arena()
+        with arena:
+            x = Value(2.0) * Value(3.0)
+        self.assertEqual(len(x.children), 0)
+        self.assertEqual(x.data, 6.0)
+        x._backward()
+
+    def test_escaped_not_reused(self):
+        arena = Arena()
+        with arena:
+            x = Value(2.0) * Value(3.0)
+        with arena:
+            y = Value(5.0) * Value(7.0)
+        self.assertIsNot(x, y)
+        self.assertEqual(x.data, 6.0)
+        self.assertEqual(y.data, 35.0)
+
+    def test_held_keeps_value(self):
+        x = MLP(3, [4, 4, 1], "tanh", seed=0)
+        arena = Arena()
+        with arena:
+            ypred = [x(x_i, idx) for idx, x_i in enumerate(XS)]
+        expected = [y.data for y in ypred]
+        with arena:
+            train_step(x)
+        self.assertEqual([y.data for y in ypred], expected)
+        self.assertFalse(any(y in arena._free for y in ypred))
+
+    def test_refcount_calibration(self):
+        held = Value(1.0)
+        nodes = [Value(2.0), held]
+        unreferenced, referenced = _refcounts(nodes)
+        self.assertLessEqual(unreferenced, _UNREFERENCED)
+        self.assertGreater(referenced, _UNREFERENCED)
+
+    def test_escaped_predictions(self):
+        x = MLP(3, [4, 1], "tanh", seed=0)
+        arena = Arena()
+        with arena:
+            ypred = [x(x_i, idx) for idx, x_i in enumerate([[1.0, 2.0, 3.0]] * 3)]
+        expected = [y.data for y in ypred]
+        for _ in range(2):
+            with arena:
+                train_step(x)
+        self.assertEqual([y.data for y in ypred], expected)
+
+    def test_keep(self):
+        arena = Arena()
+        with arena:
+            x = arena.keep(Value(2.0) * Value(3.0))
+            x.backward()
+        self.assertEqual(x.data, 6.0)
+        self.assertEqual(x.grad, 1.0)
+        self.assertEqual(len(x.children), 0)
+        self.assertNotIn(x, arena._free)
+
+    def test_no_labels(self):
+        with Arena():
+            x = Value(2.0, label="x") * Value(3.0, label="y")
+            self.assertEqual(x.label, "")
+        x = Value(2.0, label="x") * Value(3.0, label="y")
+        self.assertEqual(x.label, "(x * y)")
+
+    def test_inputs_pooled_once_per_layer(self):
+        x = Layer(2, 3, 0, initialization="constant", value=0.5)
+        arena = Arena()
+        with arena:
+            x([3.0, 7.0], 0)
+            inputs = [node for node in arena._live if node.data in (3.0, 7.0)]
+            self.assertEqual([node.data for node in inputs], [3.0, 7.0])
+            self.assertEqual([node.label for node in inputs], ["", ""])
+
+    def test_max_pool_size(self):
+        arena = Arena(max_pool_size=2)
+        with arena:
+            Value(2.0) * Value(3.0) + 1
+        self.assertEqual(len(arena), 2)
+
+    def test_gc_restored(self):
+        self.assertTrue(gc.isenabled())
+        with Arena():
+            self.assertFalse(gc.isenabled())
+        self.assertTrue(gc.isenabled())
+
+    def test_nested(self):
+        with Arena():
+            with self.assertRaises(AssertionError):
+                with Arena():
+                    pass
+        self.assertIsNone(value_module._arena)
+        self.assertIs(value_module._new, Value)
+
+
+if __name__ == "__main__":
+    unittest.main()
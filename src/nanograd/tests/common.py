@@ -0,0 +1,17 @@
+# Shared fixtures for training tests
+
+from src.nanograd.nn import MLP
+
+XS = [[2.0, 3.0, -1.0], [3.0, -1.0, 0.5], [0.5, 1.0, 1.0], [1.0, 1.0, -1.0]]
+YS = [1.0, -1.0, -1.0, 1.0]
+
+
+def train_step(mlp: MLP) -> float:
+    ypred = [mlp(x, example_idx) for example_idx, x in enumerate(XS)]
+    loss = sum(((ygt - yout) ** 2 for ygt, yout in zip(YS, ypred)))
+    for p in mlp.parameters():
+        p.grad = 0.0
+    loss.backward()
+    for p in mlp.parameters():
+        p.data += -0.05 * p.grad
+    return loss.data
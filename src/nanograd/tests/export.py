@@ -0,0 +1,70 @@
+# Tests for model export
+
+import json
+import unittest
+
+from src.nanograd.export import Program, export, export_source
+from src.nanograd.nn import MLP
+from src.nanograd.ops import register_op, unregister_op
+from src.nanograd.value import Value
+
+BATCH = [[1.0, -2.0], [0.5, 0.25], [0, 3]]
+
+
+def mlp_outputs(mlp: MLP, batch: list[list[float]]) -> list:
+    outputs = []
+    for example_idx, x in enumerate(batch):
+        out = mlp(x, example_idx)
+        outputs.append(
+            out.data if isinstance(out, Value) else [value.data for value in out]
+        )
+    return outputs
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.mlp = MLP(2, [4, 3, 2], ["tanh", "relu", "sigmoid"], seed=0)
+
+    def test_program(self):
+        self.assertEqual(export(self.mlp)(BATCH), mlp_outputs(self.mlp, BATCH))
+
+    def test_single_output(self):
+        mlp = MLP(2, [3, 1], ["tanh", "linear"], seed=0)
+        outputs = export(mlp).predict(BATCH)
+        self.assertIsInstance(outputs[0], float)
+        self.assertEqual(outputs, mlp_outputs(mlp, BATCH))
+
+    def test_serialization(self):
+        program = export(self.mlp)
+        restored = Program.from_dict(json.loads(json.dumps(program.to_dict())))
+        self.assertEqual(restored(BATCH), program(BATCH))
+
+    def test_shape_check(self):
+        program = export(self.mlp).to_dict()
+        program["layers"][1]["weights"][0].pop()
+        with self.assertRaises(AssertionError):
+            Program.from_dict(program)
+
+        program = export(self.mlp).to_dict()
+        program["layers"][0]["biases"].pop()
+        with self.assertRaises(AssertionError):
+            Program.from_dict(program)
+
+    def test_source(self):
+        namespace = {}
+        exec(export_source(self.mlp, "infer"), namespace)
+        self.assertEqual(namespace["infer"](BATCH), export(self.mlp)(BATCH))
+
+    def test_source_missing_template(self):
+        register_op("square", lambda x: x**2, lambda x, y: 2 * x)
+        try:
+            mlp = MLP(2, [2], "square", seed=0)
+            self.assertEqual(export(mlp)(BATCH), mlp_outputs(mlp, BATCH))
+            with self.assertRaises(ValueError):
+                export_source(mlp)
+        finally:
+            unregister_op("square")
+
+
+if __name__ == "__main__":
+    unittest.main()
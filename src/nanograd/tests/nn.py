@@ -1,6 +1,7 @@
 # Tests for NN interface
 # Written with GitHub Copilot
 
+import random
 import unittest
 
 from src.nanograd.nn import Neuron, Layer, MLP
@@ -20,6 +21,22 @@ class TestNeuron(unittest.TestCase):
         self.assertEqual(len(x.w), 2)
         self.assertIsInstance(x.b, Value)
 
+    def test_init_unknown(self):
+        with self.assertRaises(ValueError):
+            Neuron(2, 0, 0, initialization="unknown")
+
+    def test_activation_callable(self):
+        x = Neuron(2, 0, 0, weights=[1.0, 1.0, -3.0])
+        self.assertEqual(x([1, 1], 0).data, -1.0)
+        self.assertEqual(x([1, 1], 0, Value.relu).data, 0)
+        with self.assertRaises(TypeError):
+            x([1, 1], 0, "relu")
+
+    def test_init_weights(self):
+        x = Neuron(2, 0, 0, weights=[1.0, 2.0, 3.0])
+        self.assertEqual([w.data for w in x.w], [1.0, 2.0])
+        self.assertEqual(x.b.data, 3.0)
+
 
 class TestLayer(unittest.TestCase):
     def test_init(self):
@@ -32,6 +49,10 @@ class TestLayer(unittest.TestCase):
         x = Layer(2, 3, 0)
         x.forward([1, 1], 0)
 
+    def test_init_kwargs(self):
+        x = Layer(2, 3, 0, initialization="constant", value=0.5)
+        self.assertTrue(all(p.data == 0.5 for p in x.parameters()))
+
 
 class TestMLP(unittest.TestCase):
     def test_init(self):
@@ -42,6 +63,31 @@ class TestMLP(unittest.TestCase):
         x = MLP(2, [3, 4])
         x.forward([1, 1], 0)
 
+    def test_init_kwargs(self):
+        x = MLP(2, [3, 4], initialization="constant", value=0.5)
+        self.assertTrue(all(p.data == 0.5 for p in x.parameters()))
+
+    def test_init_seed(self):
+        x = MLP(2, [3, 4], initialization="xavier_uniform", seed=42)
+        y = MLP(2, [3, 4], initialization="xavier_uniform", seed=42)
+        self.assertEqual(
+            [p.data for p in x.parameters()], [p.data for p in y.parameters()]
+        )
+        # Layers draw from a shared generator, so they must not repeat weights
+        self.assertNotEqual(
+            [p.data for p in x.layers[0].parameters()][:9],
+            [p.data for p in x.layers[1].parameters()][:9],
+        )
+
+    def test_init_global_seed(self):
+        random.seed(0)
+        x = MLP(2, [3, 4])
+        random.seed(0)
+        y = MLP(2, [3, 4])
+        self.assertEqual(
+            [p.data for p in x.parameters()], [p.data for p in y.parameters()]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
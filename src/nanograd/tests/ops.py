@@ -0,0 +1,100 @@
+# Tests for operator registry
+
+import math
+import unittest
+
+from src.nanograd.nn import Layer
+from src.nanograd.ops import OPS, get_op, register_op, unregister_op
+from src.nanograd.value import Value
+
+BUILTIN_OPS = list(OPS)
+
+
+class TestOps(unittest.TestCase):
+    def tearDown(self):
+        if "square" in OPS:
+            unregister_op("square")
+
+    def test_get_unknown(self):
+        with self.assertRaises(ValueError):
+            get_op("unknown")
+
+    def test_activations_from_registry(self):
+        for name in OPS:
+            self.assertIn(name, Value.activations)
+
+    def test_linear_returns_self(self):
+        x = Value(2)
+        self.assertIs(Value.activations["linear"](x), x)
+
+    def test_fused_matches_derivative(self):
+        for name in ["tanh", "sigmoid", "exp"]:
+            op = get_op(name)
+            for x in [-2.0, 0.0, 2.0]:
+                y, dy = op.fused(x)
+                self.assertAlmostEqual(y, op.forward(x))
+                self.assertAlmostEqual(dy, op.derivative(x, y))
+
+    def test_vectorized(self):
+        for name in ["tanh", "relu", "sigmoid", "exp", "cos", "sin"]:
+            op = get_op(name)
+            xs = [-2.0, 0.0, 2.0]
+            self.assertEqual(op.vectorized(xs), [op.forward(x) for x in xs])
+
+    def test_definitions_agree(self):
+        for name in BUILTIN_OPS:
+            op = get_op(name)
+            xs = [0.5, 2.0] if name == "log" else [-1.5, 0.0, 0.5, 2.0]
+            expected = [op.forward(x) for x in xs]
+            self.assertEqual(op.vectorized(xs), expected, name)
+            source = [eval(op.source.format(x=repr(x)), {"math": math}) for x in xs]
+            self.assertEqual(source, expected, name)
+
+    def test_register(self):
+        register_op("square", lambda x: x**2, lambda x, y: 2 * x)
+        x = Value(3)
+        y = x.square()
+        y.backward()
+        self.assertEqual(y.data, 9)
+        self.assertEqual(x.grad, 6)
+        self.assertEqual(y.operator, "square")
+        self.assertEqual(get_op("square").vectorized([1, 2]), [1, 4])
+
+    def test_register_clash(self):
+        for name in ["grad", "backward", "apply", "__add__"]:
+            with self.assertRaises(ValueError):
+                register_op(name, lambda x: x, lambda x, y: 1.0)
+            self.assertNotIn(name, OPS)
+            self.assertNotIn(name, Value.activations)
+        self.assertTrue(callable(Value.backward))
+
+    def test_register_handwritten(self):
+        op = get_op("log")
+        register_op("log", op.forward, op.derivative, source=op.source)
+        self.assertIs(Value.activations["log"], Value.log)
+        self.assertAlmostEqual(Value(100).log(10).data, 2)
+
+    def test_unregister(self):
+        register_op("square", lambda x: x**2, lambda x, y: 2 * x)
+        unregister_op("square")
+        self.assertNotIn("square", OPS)
+        self.assertNotIn("square", Value.activations)
+        self.assertFalse(hasattr(Value, "square"))
+        with self.assertRaises(ValueError):
+            unregister_op("square")
+
+    def test_register_activation(self):
+        register_op("square", lambda x: x**2, lambda x, y: 2 * x)
+        x = Layer(2, 1, 0, "square", initialization="constant", value=1.0)
+        self.assertEqual(x([1, 1], 0).data, 9)
+
+    def test_apply_by_name(self):
+        x = Value(0)
+        y = x.apply("sin")
+        y.backward()
+        self.assertAlmostEqual(y.data, math.sin(0))
+        self.assertAlmostEqual(x.grad, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+# Tests for compact float32 parameter storage
+
+import gc
+import unittest
+
+from src.nanograd.arena import Arena
+from src.nanograd.export import export
+from src.nanograd.nn import MLP
+from src.nanograd.precision import (
+    CompactNeuron,
+    ParameterStorage,
+    ParameterView,
+    compact,
+)
+from src.nanograd.tests.common import XS, YS, train_step
+from src.nanograd.value import Value
+
+
+def compact_train_step(mlp: MLP, storage: ParameterStorage) -> float:
+    ypred = [mlp(x, example_idx) for example_idx, x in enumerate(XS)]
+    loss = sum(((ygt - yout) ** 2 for ygt, yout in zip(YS, ypred)))
+    storage.zero_grad()
+    loss.backward()
+    storage.step(0.05)
+    return loss.data
+
+
+class TestParameterStorage(unittest.TestCase):
+    def setUp(self):
+        self.storage = ParameterStorage(2)
+
+    def test_init(self):
+        self.assertEqual(list(self.storage.data), [0, 0])
+        self.assertEqual(list(self.storage.grad), [0, 0])
+
+    def test_float32_storage(self):
+        self.storage.data[0] = 0.1
+        self.assertNotEqual(self.storage.data[0], 0.1)
+        self.assertAlmostEqual(self.storage.data[0], 0.1, 6)
+
+    def test_leaves(self):
+        self.storage.data[0] = 2
+        self.storage.data[1] = 3
+        x, y = self.storage.leaves(0, 2, "w")
+        self.assertIsInstance(x, Value)
+        self.assertEqual(x.label, "w0")
+        z = x * y
+        z.backward()
+        self.assertEqual(z.data, 6)
+        self.assertEqual(list(self.storage.grad), [3, 2])
+        self.assertEqual((x.grad, y.grad), (0, 0))
+
+    def test_leaves_shared(self):
+        leaf = self.storage.leaves(0, 2)[0]
+        self.assertIs(self.storage.leaves(0, 2)[0], leaf)
+        self.storage.step(0.1)
+        self.assertIsNot(self.storage.leaves(0, 2)[0], leaf)
+
+    def test_leaves_released(self):
+        self.storage.leaves(0, 2)
+        gc.collect()
+        self.assertEqual(len(self.storage._leaves), 0)
+
+    def test_backward_sums_leaves(self):
+        self.storage.data[0] = 2
+        for _ in range(2):
+            (x,) = self.storage.leaves(0, 1)
+            x.tanh().backward()
+        self.assertAlmostEqual(2 * 0.070, self.storage.grad[0], 2)
+
+    def test_zero_grad(self):
+        self.storage.grad[0] = 1.5
+        self.storage.zero_grad()
+        self.assertEqual(self.storage.grad[0], 0)
+
+    def test_step(self):
+        self.storage.data[0] = 1.0
+        self.storage.grad[0] = 2.0
+        self.storage.step(0.25)
+        self.assertEqual(self.storage.data[0], 0.5)
+
+    def test_nbytes(self):
+        self.assertEqual(ParameterStorage(10).nbytes, 80)
+        self.assertEqual(ParameterStorage(10, "f", "d").nbytes, 120)
+
+    def test_unknown_dtype(self):
+        with self.assertRaises(AssertionError):
+            ParameterStorage(2, "i")
+
+
+class TestCompact(unittest.TestCase):
+    def test_compact(self):
+        x = MLP(3, [4, 1], "tanh", seed=0)
+        expected = [p.data for p in x.parameters()]
+        storage = compact(x)
+        self.assertEqual(len(storage), len(expected))
+        for value, expected_value in zip(storage.data, expected):
+            self.assertAlmostEqual(value, expected_value, 6)
+        for layer in x.layers:
+            for neuron in layer.neurons:
+                self.assertIsInstance(neuron, CompactNeuron)
+        params = x.parameters()
+        self.assertTrue(all(isinstance(p, ParameterView) for p in params))
+        self.assertEqual([p.data for p in params], list(storage.data))
+        self.assertEqual(params[-1].label, "l1n0b")
+
+    def test_view_write_through(self):
+        x = MLP(3, [4, 1], "tanh", seed=0)
+        storage = compact(x)
+        neuron = x.layers[1].neurons[0]
+        before = neuron([1.0, 1.0, 1.0, 1.0], 0).data
+        neuron.w[0].data = 1.0
+        neuron.b.grad = 2.0
+        self.assertEqual(storage.data[16], 1.0)
+        self.assertEqual(storage.grad[20], 2.0)
+        self.assertEqual(neuron.w[0].data, 1.0)
+        after = neuron([1.0, 1.0, 1.0, 1.0], 0).data
+        self.assertNotEqual(after, before)
+
+    def test_inference_releases_leaves(self):
+        x = MLP(3, [4, 1], "tanh", seed=0)
+        storage = compact(x)
+        ypred = [x(XS[0], example_idx) for example_idx in range(100)]
+        self.assertEqual(len(storage._leaves), 5)
+        self.assertEqual(sum(map(len, storage._leaves.values())), len(storage))
+        del ypred
+        gc.collect()
+        self.assertEqual(len(storage._leaves), 0)
+
+    def test_plain_training_loop(self):
+        x = MLP(3, [4, 4, 1], "tanh", seed=0)
+        y = MLP(3, [4, 4, 1], "tanh", seed=0)
+        compact(y, "d", "d")
+        for _ in range(20):
+            self.assertAlmostEqual(train_step(x), train_step(y))
+        for p, q in zip(x.parameters(), y.parameters()):
+            self.assertAlmostEqual(p.data, q.data)
+
+    def test_training_parity(self):
+        for dtype, grad_dtype in [("d", "d"), ("f", "f"), ("f", "d")]:
+            x = MLP(3, [4, 4, 1], "tanh", seed=0)
+            y = MLP(3, [4, 4, 1], "tanh", seed=0)
+            storage = compact(y, dtype, grad_dtype)
+            self.assertEqual(storage.grad.typecode, grad_dtype)
+            for _ in range(20):
+                self.assertAlmostEqual(train_step(x), compact_train_step(y, storage), 3)
+            for p, value in zip(x.parameters(), storage.data):
+                self.assertAlmostEqual(p.data, value, 3)
+
+    def test_export(self):
+        x = MLP(3, [4, 1], "tanh", seed=0)
+        compact(x)
+        outputs = export(x)(XS)
+        for example_idx, (x_i, output) in enumerate(zip(XS, outputs)):
+            self.assertAlmostEqual(x(x_i, example_idx).data, output)
+
+    def test_arena(self):
+        x = MLP(3, [4, 1], "tanh", seed=0)
+        y = MLP(3, [4, 1], "tanh", seed=0)
+        storage = compact(y)
+        arena = Arena()
+        for _ in range(3):
+            expected = train_step(x)
+            with arena:
+                loss = compact_train_step(y, storage)
+            self.assertAlmostEqual(loss, expected, 4)
+        num_allocated = arena.num_allocated
+        with arena:
+            compact_train_step(y, storage)
+        self.assertEqual(arena.num_allocated, num_allocated)
+
+
+if __name__ == "__main__":
+    unittest.main()
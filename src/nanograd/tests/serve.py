@@ -0,0 +1,98 @@
+# Tests for batched prediction server
+
+import asyncio
+import unittest
+
+from src.nanograd.export import export
+from src.nanograd.nn import MLP
+from src.nanograd.serve import BatchPredictor, load_test
+
+BATCH = [[1.0, -2.0], [0.5, 0.25], [0, 3], [-1, 1]]
+
+
+class TestBatchPredictor(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mlp = MLP(2, [3, 2], ["tanh", "sigmoid"], seed=0)
+
+    async def test_predict(self):
+        async with BatchPredictor(self.mlp, max_batch_size=8) as predictor:
+            outputs = await asyncio.gather(*(predictor.predict(x) for x in BATCH))
+        self.assertEqual(outputs, export(self.mlp)(BATCH))
+        self.assertEqual(predictor.metrics.num_requests, len(BATCH))
+        self.assertEqual(predictor.metrics.num_batches, 1)
+
+    async def test_max_batch_size(self):
+        async with BatchPredictor(self.mlp, max_batch_size=3) as predictor:
+            await asyncio.gather(*(predictor.predict(x) for x in BATCH))
+        self.assertEqual(predictor.metrics.num_batches, 2)
+
+    async def test_max_delay(self):
+        async with BatchPredictor(self.mlp, max_delay_ms=0) as predictor:
+            for x in BATCH:
+                await predictor.predict(x)
+        self.assertEqual(predictor.metrics.num_batches, len(BATCH))
+
+    async def test_error_isolated(self):
+        mlp = MLP(2, [1], "sigmoid", initialization="constant", value=1.0)
+        async with BatchPredictor(mlp) as predictor:
+            results = await asyncio.gather(
+                predictor.predict([1.0, 1.0]),
+                predictor.predict([-1e4, 0.0]),
+                predictor.predict([0.0, 0.0]),
+                return_exceptions=True,
+            )
+        self.assertEqual(results[0], export(mlp)([[1.0, 1.0]])[0])
+        self.assertIsInstance(results[1], OverflowError)
+        self.assertEqual(results[2], export(mlp)([[0.0, 0.0]])[0])
+        self.assertEqual(predictor.metrics.num_batches, 1)
+        self.assertEqual(predictor.metrics.num_errors, 1)
+
+    async def test_not_started(self):
+        predictor = BatchPredictor(self.mlp)
+        with self.assertRaises(RuntimeError):
+            await predictor.predict(BATCH[0])
+
+    async def test_wrong_input_size(self):
+        async with BatchPredictor(self.mlp) as predictor:
+            with self.assertRaises(AssertionError):
+                await predictor.predict([1.0])
+
+    async def test_stop_in_flight(self):
+        predictor = BatchPredictor(self.mlp, max_delay_ms=500)
+        await predictor.start()
+        request = asyncio.create_task(predictor.predict(BATCH[0]))
+        await asyncio.sleep(0.05)
+        await predictor.stop()
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncio.wait_for(request, 1)
+
+    async def test_stop_queued(self):
+        predictor = BatchPredictor(self.mlp, max_batch_size=1, max_delay_ms=500)
+        await predictor.start()
+        requests = [asyncio.create_task(predictor.predict(x)) for x in BATCH]
+        await asyncio.sleep(0)
+        await predictor.stop()
+        results = await asyncio.wait_for(
+            asyncio.gather(*requests, return_exceptions=True), 1
+        )
+        for result in results:
+            self.assertIsInstance(result, (float, list, asyncio.CancelledError))
+
+    async def test_load_test(self):
+        async with BatchPredictor(self.mlp, max_batch_size=16) as predictor:
+            stats = await load_test(predictor, num_requests=100, seed=0)
+        self.assertEqual(stats["requests"], 100)
+        self.assertEqual(stats["errors"], 0)
+        self.assertGreater(stats["mean_batch_size"], 1)
+        self.assertGreater(stats["throughput"], 0)
+        self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+
+    async def test_load_test_resets_metrics(self):
+        async with BatchPredictor(self.mlp) as predictor:
+            await asyncio.gather(*(predictor.predict(x) for x in BATCH))
+            stats = await load_test(predictor, num_requests=10, seed=0)
+        self.assertEqual(stats["requests"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
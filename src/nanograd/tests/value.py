@@ -33,6 +33,13 @@ class TestValue(unittest.TestCase):
         self.assertEqual(x.grad, -3)
         self.assertEqual(y.grad, -2)
 
+    def test_mul_self(self):
+        x = Value(3)
+        y = x * x
+        y.backward()
+        self.assertEqual(len(y.children), 1)
+        self.assertEqual(x.grad, 6)
+
     def test_add_pos(self):
         x = Value(2)
         y = Value(3)
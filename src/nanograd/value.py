@@ -1,18 +1,20 @@
 from __future__ import annotations
 import math
 
+from src.nanograd.ops import Op, get_op, on_register, on_unregister
 from src.nanograd.value_interface import ValueInterface
 from src.nanograd.visualize import draw_dot
 
 
+def _noop() -> None:
+    pass
+
+
 class Value(ValueInterface):
-    activations = {
-        "linear": lambda x: x,
-        "tanh": lambda x: x.tanh(),
-        "relu": lambda x: x.relu(),
-        "sigmoid": lambda x: x.sigmoid(),
-        "log": lambda x: x.log(),
-    }
+    __slots__ = ("data", "grad", "_backward", "children", "operator", "label")
+
+    # Filled from the operator registry, see _install_op below
+    activations = {}
 
     def __init__(
         self,
@@ -23,8 +25,8 @@ class Value(ValueInterface):
     ):
         self.data = data
         self.grad = 0.0
-        self._backward = lambda: None
-        self.children = set(children)
+        self._backward = _noop
+        self.children = children
         self.operator = operator
         self.label = label
 
@@ -33,16 +35,16 @@ class Value(ValueInterface):
 
     def __neg__(self) -> Value:
         result = self * -1
-        result.label = f"-{self.label}"
+        result.label = _label("-{}", self.label)
         return result
 
     def __add__(self, other: Value | float | int) -> Value:
-        other = other if isinstance(other, Value) else Value(other)
-        out = Value(
+        other = other if isinstance(other, Value) else _new(other)
+        out = _new(
             self.data + other.data,
-            (self, other),
+            (self, other) if other is not self else (self,),
             "+",
-            f"({self.label} + {other.label})",
+            _label("({} + {})", self.label, other.label),
         )
 
         def _backward():
@@ -57,8 +59,8 @@ class Value(ValueInterface):
 
     def __sub__(self, other: Value | float | int) -> Value:
         result = self + (-other)
-        result.label = (
-            f"({self.label} - {other.label if isinstance(other, Value) else other})"
+        result.label = _label(
+            "({} - {})", self.label, other.label if isinstance(other, Value) else other
         )
         return result
 
@@ -66,12 +68,12 @@ class Value(ValueInterface):
         return self.__sub__(other)
 
     def __mul__(self, other: Value | float | int) -> Value:
-        other = other if isinstance(other, Value) else Value(other)
-        out = Value(
+        other = other if isinstance(other, Value) else _new(other)
+        out = _new(
             self.data * other.data,
-            (self, other),
+            (self, other) if other is not self else (self,),
             "*",
-            f"({self.label} * {other.label})",
+            _label("({} * {})", self.label, other.label),
         )
 
         def _backward():
@@ -85,15 +87,18 @@ class Value(ValueInterface):
         return self.__mul__(other)
 
     def __truediv__(self, other: Value | float | int) -> Value:
-        other = other if isinstance(other, Value) else Value(other)
+        other = other if isinstance(other, Value) else _new(other)
         result = self * other**-1
-        result.label = f"({self.label} / {other.label})"
+        result.label = _label("({} / {})", self.label, other.label)
         return result
 
     def __pow__(self, other: float | int) -> Value:
         assert isinstance(other, (float, int)), "Exponent must be a scalar"
-        out = Value(
-            self.data**other, (self,), f"**{other}", f"({self.label} ** {other})"
+        out = _new(
+            self.data**other,
+            (self,),
+            f"**{other}",
+            _label("({} ** {})", self.label, other),
         )
 
         def _backward():
@@ -104,8 +109,11 @@ class Value(ValueInterface):
 
     def __rpow__(self, other: float | int) -> Value:
         assert isinstance(other, (float, int)), "Exponent must be a scalar"
-        out = Value(
-            other**self.data, (self,), f"{other}**", f"({other} ** {self.label})"
+        out = _new(
+            other**self.data,
+            (self,),
+            f"{other}**",
+            _label("({} ** {})", other, self.label),
         )
 
         def _backward():
@@ -114,42 +122,21 @@ class Value(ValueInterface):
         out._backward = _backward
         return out
 
-    def tanh(self) -> Value:
-        x = self.data
-        t = (math.exp(2 * x) - 1) / (math.exp(2 * x) + 1)
-        out = Value(t, (self,), "tanh", f"tanh({self.label})")
-
-        def _backward():
-            self.grad += (1 - t**2) * out.grad
-
-        out._backward = _backward
-        return out
-
-    def exp(self) -> Value:
-        out = Value(math.exp(self.data), (self,), "exp", f"exp({self.label})")
-
-        def _backward():
-            self.grad += out.data * out.grad
-
-        out._backward = _backward
-        return out
-
-    def relu(self) -> Value:
-        out = Value(max(0, self.data), (self,), "relu", f"relu({self.label})")
+    def apply(self, op: Op | str) -> Value:
+        op = op if isinstance(op, Op) else get_op(op)
+        label = _label("{}({})", op.name, self.label)
+        if op.fused is not None:
+            data, local_grad = op.fused(self.data)
+            out = _new(data, (self,), op.name, label)
 
-        def _backward():
-            self.grad += (self.data > 0) * out.grad
+            def _backward():
+                self.grad += local_grad * out.grad
 
-        out._backward = _backward
-        return out
+        else:
+            out = _new(op.forward(self.data), (self,), op.name, label)
 
-    def sigmoid(self) -> Value:
-        out = Value(
-            1 / (1 + math.exp(-self.data)), (self,), "sigmoid", f"sigmoid({self.label})"
-        )
-
-        def _backward():
-            self.grad += (1 - out.data) * out.data * out.grad
+            def _backward():
+                self.grad += op.derivative(self.data, out.data) * out.grad
 
         out._backward = _backward
         return out
@@ -159,7 +146,12 @@ class Value(ValueInterface):
         assert base > 0, "Logarithm base must be positive"
         assert base != 1, "Logarithm base cannot be 1"
         assert isinstance(base, (float, int)), "Logarithm base must be a scalar"
-        out = Value(math.log(self.data, base), (self,), "log", f"log({self.label})")
+        out = _new(
+            math.log(self.data, base),
+            (self,),
+            "log",
+            _label("log({})", self.label),
+        )
 
         def _backward():
             self.grad += (
@@ -172,36 +164,22 @@ class Value(ValueInterface):
     def linear(self) -> Value:
         return self
 
-    def cos(self) -> Value:
-        out = Value(math.cos(self.data), (self,), "cos", f"cos({self.label})")
-
-        def _backward():
-            self.grad += -math.sin(self.data) * out.grad
-
-        out._backward = _backward
-        return out
-
-    def sin(self) -> Value:
-        out = Value(math.sin(self.data), (self,), "sin", f"sin({self.label})")
-
-        def _backward():
-            self.grad += math.cos(self.data) * out.grad
-
-        out._backward = _backward
-        return out
-
     def backward(self) -> None:
+        # Iterative post-order walk; a recursive closure would form a reference
+        # cycle holding the whole graph until the cyclic GC runs
         topo = []
         visited = set()
-
-        def build_topo(v: Value):
-            if v not in visited:
+        stack = [(self, False)]
+        while stack:
+            v, expanded = stack.pop()
+            if expanded:
+                topo.append(v)
+            elif v not in visited:
                 visited.add(v)
+                stack.append((v, True))
                 for child in v.children:
-                    build_topo(child)
-                topo.append(v)
-
-        build_topo(self)
+                    if child not in visited:
+                        stack.append((child, False))
 
         self.grad = 1.0
         for node in reversed(topo):
@@ -209,3 +187,45 @@ class Value(ValueInterface):
 
     def visualize(self):
         return draw_dot(self)
+
+
+# Intermediate nodes are built through _new; an active Arena swaps it for its
+# pooled allocator (and labels are skipped) so plain Value() pays no overhead
+_new = Value
+_arena = None
+
+
+def _label(fmt: str, *args) -> str:
+    """Format a node label, or skip it while an Arena is active."""
+    return fmt.format(*args) if _arena is None else ""
+
+
+# Ops that may be registered under the name of a hand-written Value method
+_HANDWRITTEN_OPS = ("linear", "log")
+
+
+def _install_op(op: Op) -> None:
+    # Hand-written methods (log with a base, linear returning self) win over
+    # generated ones; generated ones are replaced when an op is re-registered.
+    method = getattr(Value, op.name, None)
+    if method is None or hasattr(method, "op"):
+
+        def method(self: Value) -> Value:
+            return self.apply(op)
+
+        method.op = op
+        method.__name__ = op.name
+        setattr(Value, op.name, method)
+    elif op.name not in _HANDWRITTEN_OPS:
+        raise ValueError(f"Operator name clashes with Value attribute: {op.name}")
+    Value.activations[op.name] = method
+
+
+def _uninstall_op(op: Op) -> None:
+    del Value.activations[op.name]
+    if hasattr(getattr(Value, op.name, None), "op"):
+        delattr(Value, op.name)
+
+
+on_register(_install_op)
+on_unregister(_uninstall_op)
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 
 
 class ValueInterface(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __init__(
         self,